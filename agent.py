@@ -11,96 +11,107 @@ The FastMCP server.py provides the same functionality but with HTTP/SSE transpor
 instead of stdio, making it more suitable for web applications and scaling.
 """
 
+import functools
+import re
+import textwrap
 from pathlib import Path
 from dotenv import load_dotenv
 
-from google.adk.agents import LlmAgent
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, SseServerParams
-
 from .config import get_config
 
 load_dotenv()
 
 # IMPORTANT: For ADK web interface, use the original stdio server
 # The FastMCP server.py is for standalone HTTP/SSE usage
-PATH_TO_BIGQUERY_MCP_SERVER_SCRIPT = str((Path(__file__).parent.parent / "big_query" / "server.py").resolve())
-
-# Load BigQuery configuration
-try:
-    bigquery_config = get_config()
-    bigquery_config.validate()
-    server_args = bigquery_config.get_server_args()
-    print(f"✅ BigQuery configuration loaded successfully")
-except Exception as e:
-    print(f"⚠️  BigQuery Configuration Warning: {e}")
-    print("💡 Using default configuration. Please check your .env file.")
-    # Fallback to basic configuration
-    class FallbackConfig:
-        def get_server_args(self):
-            return ["--project", "hale-life-467305-i9", "--location", "asia-south1"]
-    
-    bigquery_config = FallbackConfig()
-    server_args = bigquery_config.get_server_args()
+@functools.cache
+def _server_script_path() -> str:
+    """Resolve the stdio MCP server script path once (resolve() stats the filesystem)"""
+    return str((Path(__file__).parent.parent / "big_query" / "server.py").resolve())
+
+
+def _load_server_args():
+    """Load BigQuery configuration and return the MCP server arguments"""
+    try:
+        bigquery_config = get_config()
+        bigquery_config.validate()
+        server_args = bigquery_config.get_server_args()
+        print(f"✅ BigQuery configuration loaded successfully")
+    except Exception as e:
+        print(f"⚠️  BigQuery Configuration Warning: {e}")
+        print("💡 Using default configuration. Please check your .env file.")
+        # Fallback to basic configuration
+        class FallbackConfig:
+            def get_server_args(self):
+                return ["--project", "hale-life-467305-i9", "--location", "asia-south1"]
+
+        bigquery_config = FallbackConfig()
+        server_args = bigquery_config.get_server_args()
+
+    return server_args
+
+# Shared context rendered once at import time and reused by both specialist
+# prompts, so the duplicated tool/environment boilerplate isn't stored (or
+# billed as prompt tokens) twice.
+_SHARED_BQ_CONTEXT = textwrap.dedent("""
+    You are working with Google BigQuery through MCP tools.
+
+    Shared Tools:
+    - **list-tables**: Discover all available tables across datasets
+    - **describe-table**: Get detailed schema information for a table
+    - **execute-query**: Run SQL queries (use LIMIT when sampling for efficiency)
+""")
 
 # Agent-specific prompts
-DATA_DISCOVERY_PROMPT = """
-You are a BigQuery Data Discovery Specialist focused on schema exploration, data cataloging, and structure analysis. Your expertise lies in understanding and mapping data landscapes within BigQuery environments.
-
-Core Responsibilities:
-- **Data Catalog Management**: Systematically explore and document available datasets, tables, and their relationships
-- **Schema Analysis**: Deep dive into table structures, column types, constraints, and data patterns
-- **Data Profiling**: Analyze data distribution, identify unique values, detect data quality issues
-- **Relationship Discovery**: Find connections between tables through foreign key relationships and common columns
-- **Metadata Extraction**: Provide comprehensive documentation of data assets
-
-Approach:
-1. **Systematic Exploration**: Always start with list-tables to get the full landscape
-2. **Schema-First**: Use describe-table extensively to understand structure before data sampling
-3. **Pattern Recognition**: Identify naming conventions, data types, and structural patterns
-4. **Quality Assessment**: Sample data to assess completeness, consistency, and quality
-5. **Documentation**: Provide clear, structured summaries of findings
-
-Tools Available:
-- **list-tables**: Discover all available tables across datasets
-- **describe-table**: Get detailed schema information
-- **execute-query**: Sample data for pattern analysis (use LIMIT for efficiency)
-- **create-dataset**: Create new datasets for organization
-- **create-sample-tables**: Create structured sample data for testing
-
-Focus on providing structured, actionable insights about data assets and their characteristics.
-"""
+DATA_DISCOVERY_PROMPT = _SHARED_BQ_CONTEXT + textwrap.dedent("""
+    You are a BigQuery Data Discovery Specialist focused on schema exploration, data cataloging, and structure analysis. Your expertise lies in understanding and mapping data landscapes within BigQuery environments.
 
-DATA_ANALYTICS_PROMPT = """
-You are a BigQuery Data Analytics Expert specializing in statistical analysis, business intelligence, and data-driven insights. Your goal is to extract meaningful patterns and actionable insights from BigQuery datasets.
-
-Core Responsibilities:
-- **Statistical Analysis**: Perform comprehensive statistical analysis including descriptive statistics, distributions, correlations
-- **Business Intelligence**: Generate reports, dashboards concepts, and KPI calculations
-- **Trend Analysis**: Identify patterns, trends, and anomalies in data over time
-- **Comparative Analysis**: Compare segments, periods, categories for business insights
-- **Data Aggregation**: Create meaningful summaries and roll-ups for decision making
-
-Analytical Approach:
-1. **Data Understanding**: Start with schema analysis and data sampling
-2. **Exploratory Data Analysis**: Use SQL for statistical functions (COUNT, AVG, STDDEV, PERCENTILE)
-3. **Business Context**: Frame findings in business terms with actionable recommendations
-4. **Visualization Ready**: Structure results for easy visualization and reporting
-5. **Performance Aware**: Write efficient queries using appropriate aggregations and filters
-
-SQL Best Practices:
-- Use window functions for comparative analysis
-- Leverage BigQuery's statistical functions (APPROX_COUNT_DISTINCT, STDDEV, etc.)
-- Implement proper GROUP BY for segmentation analysis
-- Use CTEs for complex multi-step analysis
-- Apply appropriate WHERE clauses for time-based analysis
-
-Tools Available:
-- **execute-query**: Run analytical SQL queries
-- **describe-table**: Understand data structure for analysis design
-- **list-tables**: Identify relevant tables for cross-table analysis
-
-Always provide business-relevant insights with clear explanations and recommendations for next steps.
-"""
+    Core Responsibilities:
+    - **Data Catalog Management**: Systematically explore and document available datasets, tables, and their relationships
+    - **Schema Analysis**: Deep dive into table structures, column types, constraints, and data patterns
+    - **Data Profiling**: Analyze data distribution, identify unique values, detect data quality issues
+    - **Relationship Discovery**: Find connections between tables through foreign key relationships and common columns
+    - **Metadata Extraction**: Provide comprehensive documentation of data assets
+
+    Approach:
+    1. **Systematic Exploration**: Always start with list-tables to get the full landscape
+    2. **Schema-First**: Use describe-table extensively to understand structure before data sampling
+    3. **Pattern Recognition**: Identify naming conventions, data types, and structural patterns
+    4. **Quality Assessment**: Sample data to assess completeness, consistency, and quality
+    5. **Documentation**: Provide clear, structured summaries of findings
+
+    Additional Tools:
+    - **create-dataset**: Create new datasets for organization
+    - **create-sample-tables**: Create structured sample data for testing
+
+    Focus on providing structured, actionable insights about data assets and their characteristics.
+""")
+
+DATA_ANALYTICS_PROMPT = _SHARED_BQ_CONTEXT + textwrap.dedent("""
+    You are a BigQuery Data Analytics Expert specializing in statistical analysis, business intelligence, and data-driven insights. Your goal is to extract meaningful patterns and actionable insights from BigQuery datasets.
+
+    Core Responsibilities:
+    - **Statistical Analysis**: Perform comprehensive statistical analysis including descriptive statistics, distributions, correlations
+    - **Business Intelligence**: Generate reports, dashboards concepts, and KPI calculations
+    - **Trend Analysis**: Identify patterns, trends, and anomalies in data over time
+    - **Comparative Analysis**: Compare segments, periods, categories for business insights
+    - **Data Aggregation**: Create meaningful summaries and roll-ups for decision making
+
+    Analytical Approach:
+    1. **Data Understanding**: Start with schema analysis and data sampling
+    2. **Exploratory Data Analysis**: Use SQL for statistical functions (COUNT, AVG, STDDEV, PERCENTILE)
+    3. **Business Context**: Frame findings in business terms with actionable recommendations
+    4. **Visualization Ready**: Structure results for easy visualization and reporting
+    5. **Performance Aware**: Write efficient queries using appropriate aggregations and filters
+
+    SQL Best Practices:
+    - Use window functions for comparative analysis
+    - Leverage BigQuery's statistical functions (APPROX_COUNT_DISTINCT, STDDEV, etc.)
+    - Implement proper GROUP BY for segmentation analysis
+    - Use CTEs for complex multi-step analysis
+    - Apply appropriate WHERE clauses for time-based analysis
+
+    Always provide business-relevant insights with clear explanations and recommendations for next steps.
+""")
 
 # Orchestrator prompt for task routing
 BIGQUERY_PROMPT = """
@@ -124,48 +135,154 @@ You are a BigQuery Orchestrator Agent. Your primary role is to route user reques
 5.  **If you are unsure which agent to use**, ask the user for clarification.
 
 When routing the request, inform the user which agent you are passing it to. For example: "I'm routing this request to the Data Analytics Agent to analyze the trends for you."
+
+A deterministic keyword pre-router runs before you. If it produced a suggestion below, transfer to that sub-agent immediately without further analysis; only reason about routing yourself when the suggestion is empty.
+Pre-router suggestion: {routing_hint?}
 """
 
-# Create specialized agents
-data_discovery_agent = LlmAgent(
-    model="gemini-2.0-flash",
-    name="BigQuery_Data_Discovery_Agent",
-    instruction=DATA_DISCOVERY_PROMPT,
-    tools=[
-        MCPToolset(
-            connection_params=SseServerParams(
-                url="http://127.0.0.1:8001/sse/"
-            ),
-            # Focus on discovery tools
-            tool_filter=['list-tables', 'describe-table', 'execute-query', 'create-dataset', 'create-sample-tables']
+# Deterministic pre-router: the keyword sets the orchestrator prompt describes,
+# precomputed so classification is a couple of set intersections instead of an
+# LLM inference. Ambiguous messages (both or neither set hit) fall through to
+# the orchestrator LLM.
+_DISCOVERY_KEYWORDS = frozenset((
+    "list", "describe", "schema", "structure", "explore", "discover",
+    "catalog", "tables", "datasets", "relationships", "metadata",
+))
+_ANALYTICS_KEYWORDS = frozenset((
+    "analyze", "calculate", "statistics", "trends", "compare", "metrics",
+    "kpi", "insights", "patterns", "correlations", "aggregations", "summary",
+))
+
+
+def classify_intent(message: str):
+    """Classify a message as 'discovery' or 'analytics', or None when ambiguous"""
+    words = frozenset(re.findall(r"\w+", message.lower()))
+    in_discovery = bool(words & _DISCOVERY_KEYWORDS)
+    in_analytics = bool(words & _ANALYTICS_KEYWORDS)
+
+    if in_discovery and not in_analytics:
+        return "discovery"
+    if in_analytics and not in_discovery:
+        return "analytics"
+    return None
+
+
+def _pre_route(callback_context):
+    """before_agent_callback: stash a deterministic routing hint in state.
+
+    The orchestrator instruction injects {routing_hint?}, so an unambiguous
+    keyword match turns the routing turn into a straight transfer instead of
+    an open-ended classification.
+    """
+    intent = None
+    content = callback_context.user_content
+    if content and content.parts:
+        text = " ".join(part.text for part in content.parts if getattr(part, "text", None))
+        intent = classify_intent(text)
+
+    # Always assign the key: session state persists across turns, so a stale
+    # hint from an earlier turn would otherwise force-route an ambiguous one
+    callback_context.state["routing_hint"] = intent or ""
+
+    return None
+
+
+def _build_agents():
+    """Build the orchestrator and specialized sub-agents.
+
+    The ADK imports below pull in grpc, protobuf, and the rest of the agent
+    stack, so they are deferred until an agent is first requested — this keeps
+    `import agent` (and package cold starts) cheap.
+    """
+    from google.adk.agents import LlmAgent
+    from google.adk.tools.base_toolset import BaseToolset
+    from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, SseServerParams
+
+    _load_server_args()
+
+    class FilteredToolsetView(BaseToolset):
+        """A per-agent filtered view over a shared toolset.
+
+        Lets both sub-agents reuse one MCPToolset (and thus one SSE
+        connection) while each keeps its own tool surface — the analytics
+        agent must not see the dataset-creation tools.
+        """
+
+        def __init__(self, toolset, tool_names):
+            super().__init__()
+            self._toolset = toolset
+            self._tool_names = frozenset(tool_names)
+
+        async def get_tools(self, readonly_context=None):
+            tools = await self._toolset.get_tools(readonly_context)
+            return [tool for tool in tools if tool.name in self._tool_names]
+
+        async def close(self):
+            # Both views delegate to the one shared toolset; its close is
+            # tolerant of being called from each view during shutdown
+            await self._toolset.close()
+
+    # One toolset — and therefore one SSE connection to the backend — shared by
+    # both sub-agents instead of a per-agent instance, exposing the union of
+    # their tools. Each agent gets a filtered view with its original surface.
+    shared_toolset = MCPToolset(
+        connection_params=SseServerParams(
+            url="http://127.0.0.1:8001/sse/"
         ),
-    ],
-)
-
-data_analytics_agent = LlmAgent(
-    model="gemini-2.0-flash",
-    name="BigQuery_Data_Analytics_Agent", 
-    instruction=DATA_ANALYTICS_PROMPT,
-    tools=[
-        MCPToolset(
-            connection_params=SseServerParams(
-                url="http://127.0.0.1:8001/sse/"
-            ),
+        tool_filter=['list-tables', 'describe-table', 'execute-query', 'create-dataset', 'create-sample-tables']
+    )
+
+    # Create specialized agents
+    data_discovery_agent = LlmAgent(
+        model="gemini-2.0-flash",
+        name="BigQuery_Data_Discovery_Agent",
+        instruction=DATA_DISCOVERY_PROMPT,
+        tools=[
+            # Focus on discovery tools
+            FilteredToolsetView(shared_toolset, ['list-tables', 'describe-table', 'execute-query', 'create-dataset', 'create-sample-tables']),
+        ],
+    )
+
+    data_analytics_agent = LlmAgent(
+        model="gemini-2.0-flash",
+        name="BigQuery_Data_Analytics_Agent",
+        instruction=DATA_ANALYTICS_PROMPT,
+        tools=[
             # Focus on analytical tools
-            tool_filter=['execute-query', 'describe-table', 'list-tables']
-        ),
-    ],
-)
-
-
-# Multi-agent setup with specialized agents
-root_agent = LlmAgent(
-    name="orchestrator", 
-    model="gemini-2.0-flash",
-    instruction= BIGQUERY_PROMPT,
-    description="An orchestrator agent that routes user requests to specialized sub-agents for data discovery and data analytics in BigQuery.",
-    sub_agents=[
-        data_discovery_agent,
-        data_analytics_agent,
-    ]
-)
\ No newline at end of file
+            FilteredToolsetView(shared_toolset, ['execute-query', 'describe-table', 'list-tables']),
+        ],
+    )
+
+    # Multi-agent setup with specialized agents
+    root_agent = LlmAgent(
+        name="orchestrator",
+        model="gemini-2.0-flash",
+        instruction= BIGQUERY_PROMPT,
+        description="An orchestrator agent that routes user requests to specialized sub-agents for data discovery and data analytics in BigQuery.",
+        before_agent_callback=_pre_route,
+        sub_agents=[
+            data_discovery_agent,
+            data_analytics_agent,
+        ]
+    )
+
+    return {
+        "data_discovery_agent": data_discovery_agent,
+        "data_analytics_agent": data_analytics_agent,
+        "root_agent": root_agent,
+    }
+
+
+_agents = None
+
+
+def __getattr__(name):
+    """Lazily build the agent tree on first attribute access (PEP 562)"""
+    global _agents
+    if name in ("root_agent", "data_discovery_agent", "data_analytics_agent"):
+        if _agents is None:
+            _agents = _build_agents()
+        return _agents[name]
+    if name == "PATH_TO_BIGQUERY_MCP_SERVER_SCRIPT":
+        return _server_script_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -6,14 +6,23 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Snapshot the relevant environment once at import; the environment doesn't
+# change between instantiations, so per-instance os.getenv lookups are wasted
+_ENV = {
+    key: os.environ.get(key)
+    for key in ('BIGQUERY_PROJECT', 'BIGQUERY_LOCATION', 'BIGQUERY_KEY_FILE')
+}
+
 
 class BigQueryConfig:
     """Simple BigQuery configuration helper"""
-    
+
+    __slots__ = ('project_id', 'location', 'key_file')
+
     def __init__(self, project_id=None, location=None, key_file=None):
-        self.project_id = project_id or os.getenv('BIGQUERY_PROJECT')
-        self.location = location or os.getenv('BIGQUERY_LOCATION')
-        self.key_file = key_file or os.getenv('BIGQUERY_KEY_FILE')
+        self.project_id = project_id if project_id is not None else _ENV['BIGQUERY_PROJECT']
+        self.location = location if location is not None else _ENV['BIGQUERY_LOCATION']
+        self.key_file = key_file if key_file is not None else _ENV['BIGQUERY_KEY_FILE']
     
     def get_server_args(self):
         """Get command line arguments for the MCP server"""
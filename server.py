@@ -1,45 +1,141 @@
-from google.cloud import bigquery
-from google.oauth2 import service_account
+import asyncio
+import atexit
+import hashlib
+import itertools
 import logging
-from typing import Any, Optional
+import queue
+import re
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, TYPE_CHECKING
 import os
-import random
-import uuid
+import secrets
+import cachetools
+import orjson
 from fastmcp import FastMCP
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import pyarrow
+    from google.cloud import bigquery
+
 load_dotenv()
 
-LOG_FILE_PATH = os.path.join(os.path.dirname(__file__), "mcp_bigquery_fastmcp_server.log")
+# Log rotation is not multi-process safe: when multi-worker serving is opted
+# into (WORKERS > 1, exported by main()), each worker process gets its own
+# pid-suffixed file so concurrent rotation can't clobber another worker's log.
+try:
+    _MULTI_WORKER = int(os.getenv("WORKERS", "1")) > 1
+except ValueError:
+    _MULTI_WORKER = False
+_LOG_SUFFIX = f".{os.getpid()}" if _MULTI_WORKER else ""
+LOG_FILE_PATH = os.path.join(os.path.dirname(__file__), f"mcp_bigquery_fastmcp_server{_LOG_SUFFIX}.log")
 
 # Set up logging to both stdout and file
 logger = logging.getLogger('mcp_bigquery_fastmcp_server')
-handler_stdout = logging.StreamHandler()
-handler_file = logging.FileHandler(LOG_FILE_PATH, mode="w")
 
-# Set format for both handlers
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler_stdout.setFormatter(formatter)
-handler_file.setFormatter(formatter)
+# This module runs twice on the default launch path — once as __main__ and once
+# as "server" when uvicorn loads the factory import string — and the named
+# logger is shared, so only attach handlers on the first import.
+if not logger.handlers:
+    handler_stdout = logging.StreamHandler()
+    handler_file = RotatingFileHandler(LOG_FILE_PATH, mode="a", maxBytes=10 * 1024 * 1024, backupCount=3)
+
+    # Set format for both handlers
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handler_stdout.setFormatter(formatter)
+    handler_file.setFormatter(formatter)
+
+    # Route records through a queue so request threads only pay a queue put;
+    # the listener thread does the actual stream/file writes
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, handler_stdout, handler_file, respect_handler_level=True)
+    log_listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
-# Add both handlers to logger
-logger.addHandler(handler_stdout)
-logger.addHandler(handler_file)
+    # The listener thread is a daemon; flush whatever is still queued at exit
+    atexit.register(log_listener.stop)
 
-# Set overall logging level
-logger.setLevel(logging.DEBUG)
+    # Set overall logging level
+    logger.setLevel(logging.DEBUG)
 
 logger.info("Starting FastMCP BigQuery Server")
 
+# How long cached table/schema metadata stays fresh. Agents tend to browse the
+# same tables repeatedly within a session, so even a short TTL absorbs most calls.
+METADATA_CACHE_TTL = 60
+
+# Guard rails for agent-issued SQL: cap billed bytes per query and the number of
+# rows pulled into memory, so an over-broad SELECT can't OOM the server or run
+# up cost. Both are overridable via environment variables.
+MAX_BYTES_BILLED = int(os.getenv("BIGQUERY_MAX_BYTES_BILLED", str(10 * 1024**3)))
+MAX_RESULT_ROWS = int(os.getenv("BIGQUERY_MAX_RESULT_ROWS", "10000"))
+RESULT_PAGE_SIZE = 10000
+
+# Query template for describe_table. The dataset path can't be a query
+# parameter, so it is interpolated — but only after validating it against
+# _IDENTIFIER_RE (letters, digits, underscores, dots, and the hyphens allowed
+# in project ids), which closes the injection path.
+DESCRIBE_TABLE_SQL = "SELECT ddl FROM `{dataset}`.INFORMATION_SCHEMA.TABLES WHERE table_name = @table_name"
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$")
+
+# How long cached query results stay fresh. Analytics agents re-issue nearly
+# identical queries within a session, so hits cost zero BigQuery round trips.
+RESULT_CACHE_TTL = 300
+
+# Queries whose results depend on evaluation time or randomness, plus anything
+# DML/DDL, must never be served from the result cache
+_VOLATILE_SQL_RE = re.compile(
+    r"\b(CURRENT_TIMESTAMP|CURRENT_DATETIME|CURRENT_DATE|CURRENT_TIME|RAND|GENERATE_UUID|SESSION_USER"
+    r"|INSERT|UPDATE|DELETE|MERGE|CREATE|ALTER|DROP|TRUNCATE)\b",
+    re.IGNORECASE,
+)
+
+# Matches single- or double-quoted SQL string literals (with backslash escapes)
+_QUOTED_LITERAL_RE = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")")
+
+def _collapse_whitespace(segment: str) -> str:
+    """Collapse runs of whitespace to single spaces, keeping edge spacing"""
+    collapsed = " ".join(segment.split())
+    if segment[:1].isspace():
+        collapsed = " " + collapsed
+    if segment[-1:].isspace():
+        collapsed = collapsed + " "
+    return collapsed
+
+def _normalize_sql(query: str) -> str:
+    """Normalize SQL so trivially different query strings share a cache entry"""
+    try:
+        import sqlparse
+        query = sqlparse.format(query, strip_comments=True, keyword_case="upper")
+    except ImportError:
+        pass
+
+    # Collapse whitespace only outside quoted literals: 'a  b' and 'a b' are
+    # different values and must not share a cache entry
+    parts = _QUOTED_LITERAL_RE.split(query)
+    return "".join(
+        part if i % 2 else _collapse_whitespace(part)
+        for i, part in enumerate(parts)
+    ).strip()
+
 class BigQueryDatabase:
     def __init__(self, project: str, location: str, key_file: Optional[str]):
         """Initialize a BigQuery database client"""
-        logger.info(f"Initializing BigQuery client for project: {project}, location: {location}, key_file: {key_file}")
+        # Deferred imports: google.cloud pulls in grpc/protobuf, which dominates
+        # process start-up time. Importing here keeps cold starts cheap until a
+        # client is actually constructed.
+        import requests.adapters
+        from google.cloud import bigquery
+        from google.oauth2 import service_account
+
+        logger.info("Initializing BigQuery client for project: %s, location: %s, key_file: %s", project, location, key_file)
         if not project:
             raise ValueError("Project is required")
         if not location:
             raise ValueError("Location is required")
-        
+
         credentials: service_account.Credentials | None = None
         if key_file:
             try:
@@ -49,89 +145,234 @@ class BigQueryDatabase:
                     scopes=["https://www.googleapis.com/auth/cloud-platform"],
                 )
             except Exception as e:
-                logger.error(f"Error loading service account credentials: {e}")
+                logger.error("Error loading service account credentials: %s", e)
                 raise ValueError(f"Invalid key file: {e}")
 
         self.client = bigquery.Client(credentials=credentials, project=project, location=location)
+        # TTLCache is not thread-safe and the MCP tools call into these caches
+        # from asyncio.to_thread workers, so all access goes through this lock
+        self._metadata_cache = cachetools.TTLCache(maxsize=1024, ttl=METADATA_CACHE_TTL)
+        self._result_cache = cachetools.TTLCache(maxsize=512, ttl=RESULT_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+
+        # Size the HTTP connection pool for concurrent tool calls under the SSE
+        # transport so they don't serialize on connection setup
+        self.client._http.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=3),
+        )
 
-    def execute_query(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Execute a SQL query and return results as a list of dictionaries"""
-        logger.debug(f"Executing query: {query}")
+        # Optional fast path: BigQuery Storage API + Arrow for columnar result
+        # downloads. Probe once here so query paths don't re-attempt imports.
+        try:
+            import pyarrow  # noqa: F401
+            self._has_arrow = True
+        except ImportError:
+            self._has_arrow = False
+
+        # Build the Storage API client once so the gRPC channel is reused across queries
+        self._bqstorage_client = None
+        try:
+            from google.cloud import bigquery_storage
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self.client._credentials
+            )
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning("Could not create BigQuery Storage client, falling back to REST: %s", e)
+
+        # Pre-warm the connection: pay the TLS + OAuth handshake here instead of
+        # on the first tool call
+        try:
+            self.client.query("SELECT 1").result()
+            logger.debug("BigQuery connection pre-warmed")
+        except Exception as e:
+            logger.warning("Connection warm-up failed (continuing anyway): %s", e)
+
+    def _run_query(self, query: str, params: "list[bigquery.ScalarQueryParameter] | None" = None,
+                   max_results: Optional[int] = MAX_RESULT_ROWS):
+        """Run a query and return its RowIterator"""
+        from google.cloud import bigquery
+
+        # use_query_cache keeps repeated queries eligible for BigQuery's
+        # cached-results path; maximum_bytes_billed bounds per-query cost
+        job_config = bigquery.QueryJobConfig(
+            maximum_bytes_billed=MAX_BYTES_BILLED,
+            use_query_cache=True,
+        )
+        if params:
+            job_config.query_parameters = params
+
+        job = self.client.query(query, job_config=job_config)
+        return job.result(page_size=RESULT_PAGE_SIZE, max_results=max_results)
+
+    def execute_query_arrow(self, query: str, params: "list[bigquery.ScalarQueryParameter] | None" = None,
+                            max_results: Optional[int] = MAX_RESULT_ROWS) -> "pyarrow.Table":
+        """Execute a SQL query and return results as an Arrow table"""
+        import pyarrow
+
+        logger.debug("Executing query (arrow): %s", query)
         try:
-            if params:
-                job = self.client.query(query, job_config=bigquery.QueryJobConfig(query_parameters=params))
+            # RowIterator refuses a bqstorage_client when max_results is set
+            # (it would warn and fall back to REST), so fetch without it and
+            # stop consuming Arrow batches once the row cap is reached instead
+            results = self._run_query(query, params, max_results=None)
+
+            batches = []
+            rows_seen = 0
+            for batch in results.to_arrow_iterable(bqstorage_client=self._bqstorage_client):
+                batches.append(batch)
+                rows_seen += batch.num_rows
+                if max_results is not None and rows_seen >= max_results:
+                    break
+
+            if batches:
+                table = pyarrow.Table.from_batches(batches)
+                if max_results is not None and table.num_rows > max_results:
+                    table = table.slice(0, max_results)
             else:
-                job = self.client.query(query)
-                
-            results = job.result()
-            rows = [dict(row.items()) for row in results]
-            logger.debug(f"Query returned {len(rows)} rows")
-            return rows
+                table = results.to_arrow()
+
+            logger.debug("Query returned %s rows", table.num_rows)
+            return table
         except Exception as e:
-            logger.error(f"Database error executing query: {e}")
+            logger.error("Database error executing query: %s", e)
             raise
+
+    def _result_cache_key(self, query: str, params, max_results) -> Optional[str]:
+        """Hash a normalized query into a cache key, or None if uncacheable"""
+        normalized = _normalize_sql(query)
+        if _VOLATILE_SQL_RE.search(normalized):
+            return None
+
+        param_repr = repr([(p.name, p.type_, p.value) for p in params]) if params else ""
+        digest = hashlib.blake2b(
+            f"{normalized}|{param_repr}|{max_results}".encode(), digest_size=16
+        )
+        return digest.hexdigest()
+
+    def execute_query(self, query: str, params: "list[bigquery.ScalarQueryParameter] | None" = None,
+                      max_results: Optional[int] = MAX_RESULT_ROWS) -> list[dict[str, Any]]:
+        """Execute a SQL query and return results as a list of dictionaries"""
+        cache_key = self._result_cache_key(query, params, max_results)
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Executing query: %s (result cache: hit)", query)
+                return cached
+
+        if self._has_arrow:
+            # Columnar download through Arrow; decoding happens in C instead of
+            # a per-cell Python loop, and the Storage API streams in parallel
+            rows = self.execute_query_arrow(query, params, max_results).to_pylist()
+        else:
+            logger.debug("Executing query: %s", query)
+            try:
+                results = self._run_query(query, params, max_results)
+                rows = [dict(row.items()) for row in results]
+                logger.debug("Query returned %s rows", len(rows))
+            except Exception as e:
+                logger.error("Database error executing query: %s", e)
+                raise
+
+        if cache_key is not None:
+            with self._cache_lock:
+                self._result_cache[cache_key] = rows
+        return rows
     
     def list_tables(self) -> list[str]:
         """List all tables in the BigQuery database"""
-        logger.debug("Listing all tables")
+        cache_key = ("list_tables", self.client.project)
+        with self._cache_lock:
+            cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Listing all tables (cache: hit)")
+            return cached
+        logger.debug("Listing all tables (cache: miss)")
 
         datasets = list(self.client.list_datasets())
-        logger.debug(f"Found {len(datasets)} datasets")
+        logger.debug("Found %s datasets", len(datasets))
 
+        def _dataset_tables(dataset) -> list[str]:
+            return [
+                f"{dataset.dataset_id}.{table.table_id}"
+                for table in self.client.list_tables(dataset.dataset_id)
+            ]
+
+        # Fan out one request per dataset; the client is thread-safe and each
+        # call is an independent HTTPS round trip
         tables = []
-        for dataset in datasets:
-            dataset_tables = self.client.list_tables(dataset.dataset_id)
-            tables.extend([
-                f"{dataset.dataset_id}.{table.table_id}" for table in dataset_tables
-            ])
+        with ThreadPoolExecutor(max_workers=min(32, len(datasets) or 1)) as executor:
+            for dataset_tables in executor.map(_dataset_tables, datasets):
+                tables.extend(dataset_tables)
 
-        logger.debug(f"Found {len(tables)} tables")
+        logger.debug("Found %s tables", len(tables))
+        with self._cache_lock:
+            self._metadata_cache[cache_key] = tables
         return tables
 
     def describe_table(self, table_name: str) -> list[dict[str, Any]]:
         """Describe a table in the BigQuery database"""
-        logger.debug(f"Describing table: {table_name}")
+        cache_key = ("describe_table", self.client.project, table_name)
+        with self._cache_lock:
+            cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Describing table: %s (cache: hit)", table_name)
+            return cached
+        logger.debug("Describing table: %s (cache: miss)", table_name)
 
         parts = table_name.split(".")
         if len(parts) != 2 and len(parts) != 3:
             raise ValueError(f"Invalid table name: {table_name}")
 
+        from google.cloud import bigquery
+
         dataset_id = ".".join(parts[:-1])
         table_id = parts[-1]
 
-        query = f"""
-            SELECT ddl
-            FROM {dataset_id}.INFORMATION_SCHEMA.TABLES
-            WHERE table_name = @table_name;
-        """
-        return self.execute_query(query, params=[
+        if not _IDENTIFIER_RE.match(dataset_id):
+            raise ValueError(f"Invalid dataset identifier: {dataset_id}")
+
+        query = DESCRIBE_TABLE_SQL.format(dataset=dataset_id)
+        results = self.execute_query(query, params=[
             bigquery.ScalarQueryParameter("table_name", "STRING", table_id),
         ])
+        with self._cache_lock:
+            self._metadata_cache[cache_key] = results
+        return results
 
     def create_dataset(self, dataset_name: str, location: Optional[str] = None) -> str:
         """Create a new dataset in BigQuery"""
-        logger.debug(f"Creating dataset: {dataset_name}")
-        
+        from google.cloud import bigquery
+
+        logger.debug("Creating dataset: %s", dataset_name)
+
         dataset_ref = self.client.dataset(dataset_name)
         dataset = bigquery.Dataset(dataset_ref)
         dataset.location = location or "US"
         
         try:
             self.client.create_dataset(dataset)
-            logger.info(f"Dataset {dataset_name} created successfully")
+            with self._cache_lock:
+                self._metadata_cache.pop(("list_tables", self.client.project), None)
+            logger.info("Dataset %s created successfully", dataset_name)
             return f"Dataset {dataset_name} created successfully"
         except Exception as e:
             if "Already Exists" in str(e):
-                logger.info(f"Dataset {dataset_name} already exists")
+                logger.info("Dataset %s already exists", dataset_name)
                 return f"Dataset {dataset_name} already exists"
             else:
-                logger.error(f"Error creating dataset: {e}")
+                logger.error("Error creating dataset: %s", e)
                 raise
 
     def create_sample_tables(self, dataset_name: str) -> str:
         """Create sample departments and employees tables"""
-        logger.debug(f"Creating sample tables in dataset: {dataset_name}")
-        
+        from google.cloud import bigquery
+
+        logger.debug("Creating sample tables in dataset: %s", dataset_name)
+
         # Create departments table
         departments_schema = [
             bigquery.SchemaField("dept_id", "STRING", mode="REQUIRED"),
@@ -155,56 +396,99 @@ class BigQueryDatabase:
             # Create both tables
             self.client.create_table(dept_table)
             self.client.create_table(emp_table)
+            with self._cache_lock:
+                self._metadata_cache.pop(("list_tables", self.client.project), None)
             logger.info("Sample tables created successfully")
             return "Sample tables (departments and employees) created successfully"
         except Exception as e:
             if "Already Exists" in str(e):
                 return "Sample tables already exist"
             else:
-                logger.error(f"Error creating tables: {e}")
+                logger.error("Error creating tables: %s", e)
                 raise
 
-    def insert_sample_data(self, dataset_name: str) -> str:
+    def _load_rows(self, table_id: str, rows: list[dict[str, Any]], schema: list, batch_size: int) -> int:
+        """Load rows into a table in batches using load jobs (not streaming inserts)"""
+        from google.cloud import bigquery
+
+        job_config = bigquery.LoadJobConfig(write_disposition="WRITE_APPEND", schema=schema)
+
+        loaded = 0
+        rows_iter = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows_iter, batch_size))
+            if not batch:
+                break
+            self.client.load_table_from_json(batch, table_id, job_config=job_config).result()
+            loaded += len(batch)
+
+        return loaded
+
+    def insert_sample_data(self, dataset_name: str, batch_size: int = 10000) -> str:
         """Insert sample data into departments and employees tables"""
-        logger.debug(f"Inserting sample data into dataset: {dataset_name}")
-        
+        from google.cloud import bigquery
+
+        logger.debug("Inserting sample data into dataset: %s", dataset_name)
+
+        departments_schema = [
+            bigquery.SchemaField("dept_id", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("dept_name", "STRING", mode="REQUIRED")
+        ]
+        employees_schema = [
+            bigquery.SchemaField("emp_id", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("emp_name", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("dept_id", "STRING", mode="REQUIRED")
+        ]
+
         # Insert departments
         departments = [
             {"dept_id": f"dept_{i}", "dept_name": f"Department_{i}"}
             for i in range(1, 11)
         ]
-        
-        errors = self.client.insert_rows_json(
-            f"{self.client.project}.{dataset_name}.departments", departments
-        )
-        if errors:
-            logger.error(f"Error inserting departments: {errors}")
-            return f"Error inserting departments: {errors}"
-        
-        # Insert employees
-        employees = []
-        for i in range(1, 51):
-            dept_id = random.choice(departments)["dept_id"]
-            emp = {
-                "emp_id": f"emp_{uuid.uuid4().hex[:8]}",
+
+        try:
+            self._load_rows(
+                f"{self.client.project}.{dataset_name}.departments",
+                departments, departments_schema, batch_size
+            )
+        except Exception as e:
+            logger.error("Error inserting departments: %s", e)
+            return f"Error inserting departments: {e}"
+
+        # Insert employees: sample department assignments in one vectorized
+        # draw instead of one random.choice call per row, so this template
+        # scales past the 50-row sample
+        import numpy as np
+
+        num_employees = 50
+        rng = np.random.default_rng()
+        dept_ids = np.array([d["dept_id"] for d in departments])
+        chosen = rng.choice(dept_ids, size=num_employees)
+
+        employees = [
+            {
+                "emp_id": f"emp_{secrets.token_hex(4)}",
                 "emp_name": f"Employee_{i}",
                 "dept_id": dept_id
             }
-            employees.append(emp)
-        
-        errors = self.client.insert_rows_json(
-            f"{self.client.project}.{dataset_name}.employees", employees
-        )
-        if errors:
-            logger.error(f"Error inserting employees: {errors}")
-            return f"Error inserting employees: {errors}"
-        
+            for i, dept_id in enumerate(chosen.tolist(), 1)
+        ]
+
+        try:
+            self._load_rows(
+                f"{self.client.project}.{dataset_name}.employees",
+                employees, employees_schema, batch_size
+            )
+        except Exception as e:
+            logger.error("Error inserting employees: %s", e)
+            return f"Error inserting employees: {e}"
+
         logger.info("Sample data inserted successfully")
         return "Sample data inserted successfully (10 departments, 50 employees)"
 
     def create_complete_sample(self, dataset_name: str, location: Optional[str] = None) -> str:
         """Create dataset, tables, and insert sample data in one go"""
-        logger.info(f"Creating complete sample setup for dataset: {dataset_name}")
+        logger.info("Creating complete sample setup for dataset: %s", dataset_name)
         
         result = []
         
@@ -237,102 +521,163 @@ db: Optional[BigQueryDatabase] = None
 # Initialize FastMCP server
 mcp = FastMCP("BigQuery_FastMCP_Server")
 
+def _to_json(results: Any) -> str:
+    """Serialize tool results as JSON (orjson handles datetime/Decimal via default=str)"""
+    return orjson.dumps(results, default=str, option=orjson.OPT_NAIVE_UTC).decode()
+
 @mcp.tool()
-def execute_query(query: str) -> str:
+async def execute_query(query: str) -> str:
     """Execute a SELECT query on the BigQuery database"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        results = db.execute_query(query)
-        return str(results)
+        results = await asyncio.to_thread(db.execute_query, query)
+        payload = _to_json(results)
+        if len(results) >= MAX_RESULT_ROWS:
+            payload += f"\n...truncated at {MAX_RESULT_ROWS} rows"
+        return payload
     except Exception as e:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def list_tables() -> str:
+async def list_tables() -> str:
     """List all tables in the BigQuery database"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        results = db.list_tables()
-        return str(results)
+        results = await asyncio.to_thread(db.list_tables)
+        return _to_json(results)
     except Exception as e:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def describe_table(table_name: str) -> str:
+async def describe_table(table_name: str) -> str:
     """Get the schema information for a specific table"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        results = db.describe_table(table_name)
-        return str(results)
+        results = await asyncio.to_thread(db.describe_table, table_name)
+        return _to_json(results)
     except Exception as e:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def create_dataset(dataset_name: str, location: str = "US") -> str:
+async def create_dataset(dataset_name: str, location: str = "US") -> str:
     """Create a new BigQuery dataset"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        result = db.create_dataset(dataset_name, location)
+        result = await asyncio.to_thread(db.create_dataset, dataset_name, location)
         return result
     except Exception as e:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def create_sample_tables(dataset_name: str) -> str:
+async def create_sample_tables(dataset_name: str) -> str:
     """Create sample departments and employees tables in a dataset"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        result = db.create_sample_tables(dataset_name)
+        result = await asyncio.to_thread(db.create_sample_tables, dataset_name)
         return result
     except Exception as e:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def insert_sample_data(dataset_name: str) -> str:
+async def insert_sample_data(dataset_name: str) -> str:
     """Insert sample data into departments and employees tables"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        result = db.insert_sample_data(dataset_name)
+        result = await asyncio.to_thread(db.insert_sample_data, dataset_name)
         return result
     except Exception as e:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def create_complete_sample(dataset_name: str, location: str = "asia-south1") -> str:
+async def create_complete_sample(dataset_name: str, location: str = "asia-south1") -> str:
     """Create dataset, sample tables, and insert data in one step"""
     if not db:
         return "Error: Database not initialized"
     
     try:
-        result = db.create_complete_sample(dataset_name, location)
+        result = await asyncio.to_thread(db.create_complete_sample, dataset_name, location)
         return result
     except Exception as e:
         return f"Error: {str(e)}"
 
-def main(project: str, location: str, key_file: Optional[str], host: str = "127.0.0.1", port: int = 8000):
-    """Main function to start the FastMCP server with SSE"""
+def create_app():
+    """App factory for uvicorn: build the per-process database connection, then
+    return FastMCP's ASGI app.
+
+    Each uvicorn worker is a separate process, so the BigQuery client has to be
+    initialized here (from the environment) rather than shared from main().
+    """
     global db
-    
-    logger.info(f"Starting FastMCP BigQuery Server with project: {project} and location: {location}")
-    logger.info(f"Server will run on {host}:{port}")
-    
-    # Initialize database connection
+
+    project = os.getenv('BIGQUERY_PROJECT')
+    location = os.getenv('BIGQUERY_LOCATION', 'US')
+    key_file = os.getenv('BIGQUERY_KEY_FILE')
+
     db = BigQueryDatabase(project, location, key_file)
-    
-    # Run FastMCP server with SSE transport
-    mcp.run(transport="sse", host=host, port=port)
+    return mcp.http_app(transport="sse")
+
+def main(project: str, location: str, key_file: Optional[str], host: str = "127.0.0.1", port: int = 8000,
+         workers: Optional[int] = None):
+    """Main function to start the FastMCP server with SSE"""
+    import uvicorn
+
+    logger.info("Starting FastMCP BigQuery Server with project: %s and location: %s", project, location)
+    logger.info("Server will run on %s:%s", host, port)
+
+    # Default to a single worker: the SSE transport keeps session state in
+    # process memory, so multiple workers behind one socket would route a
+    # client's POST /messages/ to a worker that doesn't know its session.
+    # Multi-worker serving is an explicit opt-in for deployments that add
+    # sticky routing (or a stateless transport) in front of the server.
+    workers = workers or 1
+    if workers > 1:
+        logger.warning(
+            "Running %s workers: SSE sessions are per-process, so this requires "
+            "sticky routing in front of the server", workers
+        )
+
+    # Worker processes re-import this module, so hand them the configuration
+    # through the environment
+    os.environ['BIGQUERY_PROJECT'] = project
+    os.environ['BIGQUERY_LOCATION'] = location
+    os.environ['WORKERS'] = str(workers)
+    if key_file:
+        os.environ['BIGQUERY_KEY_FILE'] = key_file
+
+    # Prefer the libuv event loop and C http parser when available
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+
+    uvicorn.run(
+        "server:create_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        log_config=None,
+    )
 
 if __name__ == "__main__":
     import argparse
@@ -343,19 +688,22 @@ if __name__ == "__main__":
     key_file = os.getenv('BIGQUERY_KEY_FILE')
     host = os.getenv('HOST', 'localhost')
     port = int(os.getenv('PORT', '8000'))
-    
+    workers = int(os.getenv('WORKERS', '0')) or None
+
     parser = argparse.ArgumentParser(description='BigQuery FastMCP Server with SSE')
     parser.add_argument('--project', default=project, help='BigQuery project ID')
     parser.add_argument('--location', default=location, help='BigQuery location')
     parser.add_argument('--key-file', default=key_file, help='Path to service account key file')
     parser.add_argument('--host', default=host, help='Host to run the server on')
     parser.add_argument('--port', type=int, default=port, help='Port to run the server on')
-    
+    parser.add_argument('--workers', type=int, default=workers,
+                        help='Number of uvicorn workers (default: 1; >1 requires sticky session routing)')
+
     args = parser.parse_args()
-    
+
     # Check if project is provided either via env var or command line
     if not args.project:
         logger.error("Project is required. Set BIGQUERY_PROJECT environment variable or use --project argument")
         exit(1)
-    
-    main(args.project, args.location, args.key_file, args.host, args.port)
+
+    main(args.project, args.location, args.key_file, args.host, args.port, args.workers)